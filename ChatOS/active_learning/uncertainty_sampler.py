@@ -6,6 +6,7 @@ is uncertain, which are good candidates for active learning.
 """
 
 import asyncio
+import logging
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -21,6 +22,8 @@ from ChatOS.database.models import (
     TrainingExample,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class UncertainExample:
@@ -46,6 +49,7 @@ class UncertaintySampler:
         self,
         ollama_host: Optional[str] = None,
         model: str = "qwen2.5:7b",
+        max_concurrent: int = 4,
     ):
         """
         Initialize the uncertainty sampler.
@@ -53,9 +57,11 @@ class UncertaintySampler:
         Args:
             ollama_host: Ollama API host
             model: Model to use for confidence evaluation
+            max_concurrent: Maximum evaluations in flight at once
         """
         self.ollama_host = ollama_host or settings.ollama_host
         self.model = model
+        self.max_concurrent = max_concurrent
     
     async def evaluate_confidence(
         self,
@@ -165,6 +171,8 @@ class UncertaintySampler:
         """
         Update confidence scores for a batch of examples.
         
+        Examples are evaluated concurrently, at most `max_concurrent` at a time.
+        
         Args:
             example_ids: List of example IDs to evaluate
             progress_callback: Optional progress callback
@@ -172,39 +180,71 @@ class UncertaintySampler:
         Returns:
             Number of examples updated
         """
-        updated = 0
         total = len(example_ids)
+        completed = 0
+        semaphore = asyncio.Semaphore(self.max_concurrent)
         
-        for idx, example_id in enumerate(example_ids):
-            with DatabaseSession() as db:
-                example = db.query(TrainingExample).filter(
-                    TrainingExample.id == example_id
-                ).first()
-                
-                if not example:
-                    continue
-                
-                # Evaluate confidence
-                confidence, reason = await self.evaluate_confidence(
-                    example.user_input,
-                    example.assistant_output,
-                )
-                
-                # Update example
-                example.confidence_score = confidence
-                example.extra_data = example.extra_data or {}
-                example.extra_data["uncertainty_reason"] = reason
-                example.extra_data["confidence_evaluated_at"] = datetime.utcnow().isoformat()
-                
-                updated += 1
+        async def _evaluate(example_id: int) -> bool:
+            nonlocal completed
+            try:
+                # Bound in-flight requests to avoid overwhelming Ollama
+                async with semaphore:
+                    return await self._update_example_confidence(example_id)
+            except Exception:
+                logger.exception(f"Failed to update confidence for example {example_id}")
+                return False
+            finally:
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total)
+        
+        results = await asyncio.gather(
+            *[_evaluate(example_id) for example_id in example_ids]
+        )
+        
+        return sum(results)
+    
+    async def _update_example_confidence(self, example_id: int) -> bool:
+        """
+        Evaluate and store the confidence score for a single example.
+        
+        The database session is not held while waiting on the model.
+        
+        Returns:
+            True if the example was updated
+        """
+        with DatabaseSession() as db:
+            example = db.query(TrainingExample).filter(
+                TrainingExample.id == example_id
+            ).first()
+            
+            if not example:
+                return False
+            
+            user_input = example.user_input
+            assistant_output = example.assistant_output
+        
+        # Evaluate confidence
+        confidence, reason = await self.evaluate_confidence(
+            user_input,
+            assistant_output,
+        )
+        
+        with DatabaseSession() as db:
+            example = db.query(TrainingExample).filter(
+                TrainingExample.id == example_id
+            ).first()
             
-            if progress_callback:
-                progress_callback(idx + 1, total)
+            if not example:
+                return False
             
-            # Small delay to avoid overwhelming Ollama
-            await asyncio.sleep(0.1)
+            # Update example
+            example.confidence_score = confidence
+            example.extra_data = example.extra_data or {}
+            example.extra_data["uncertainty_reason"] = reason
+            example.extra_data["confidence_evaluated_at"] = datetime.utcnow().isoformat()
         
-        return updated
+        return True
     
     def get_uncertain_examples(
         self,
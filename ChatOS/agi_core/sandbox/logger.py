@@ -4,13 +4,80 @@ Sandbox Logger for AGI Core
 Logs and tracks all sandbox operations for analysis and training.
 """
 
+import atexit
 import json
+import logging
+import os
 import time
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from enum import Enum
 
+from ChatOS.utils.fast_json import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+
+# Records kept on disk and in memory; files are compacted back to this size
+# once they grow to twice the limit.
+MAX_OPERATIONS = 500
+MAX_EXECUTIONS = 200
+
+# Buffers per writev() call; IOV_MAX is 1024 on Linux and macOS
+_WRITEV_BATCH = 1024
+
+
+def _json_lines(records: List[Dict[str, Any]]) -> List[bytes]:
+    """Encode records as JSON Lines rows, skipping any that cannot be serialized."""
+    lines = []
+    for record in records:
+        try:
+            lines.append(json_dumps(record, newline=True))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Dropping unserializable sandbox log record: {e}")
+    return lines
+
+
+def _read_jsonl(path: Path, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Read the last `limit` records of a JSONL file and its total line count."""
+    lines = [line for line in path.read_bytes().splitlines() if line.strip()]
+    records = []
+    for line in lines[-limit:]:
+        try:
+            records.append(json_loads(line))
+        except ValueError:
+            continue
+    return records, len(lines)
+
+
+def _append_jsonl(path: Path, records: List[Dict[str, Any]]) -> None:
+    """Append records to a JSONL file, gathering them into one writev() where available."""
+    lines = _json_lines(records)
+    if not hasattr(os, "writev"):
+        with open(path, "ab") as f:
+            f.write(b"".join(lines))
+        return
+    
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        for start in range(0, len(lines), _WRITEV_BATCH):
+            batch = lines[start:start + _WRITEV_BATCH]
+            written = os.writev(fd, batch)
+            if written < sum(map(len, batch)):
+                # Finish a short write with plain writes
+                rest = b"".join(batch)[written:]
+                while rest:
+                    rest = rest[os.write(fd, rest):]
+    finally:
+        os.close(fd)
+
+
+def _write_jsonl(path: Path, records: List[Dict[str, Any]]) -> None:
+    """Rewrite a JSONL file with the given records."""
+    path.write_bytes(b"".join(_json_lines(records)))
+
 
 class SandboxOperation(Enum):
     """Types of sandbox operations."""
@@ -103,57 +170,115 @@ class SandboxLogger:
         logger.log_file_read("/path/to/file.py", success=True)
         logger.log_execution(code="print('hi')", stdout="hi", exit_code=0)
         stats = logger.get_stats()
+    
+    Records are buffered in memory and appended to disk every `flush_every`
+    records and on flush(). The shared get_sandbox_logger() instance is also
+    flushed at interpreter exit.
     """
     
-    def __init__(self, storage_path: Optional[Path] = None):
+    def __init__(self, storage_path: Optional[Path] = None, flush_every: int = 20):
         self.storage_path = storage_path or Path.home() / "ChatOS-Memory" / "agi" / "sandbox_logs"
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
-        self.log_file = self.storage_path / "operations.json"
-        self.execution_log_file = self.storage_path / "executions.json"
+        self.log_file = self.storage_path / "operations.jsonl"
+        self.execution_log_file = self.storage_path / "executions.jsonl"
         
-        self._entries: List[SandboxLogEntry] = []
-        self._executions: List[ExecutionLog] = []
+        self._entries: Deque[SandboxLogEntry] = deque(maxlen=MAX_OPERATIONS)
+        self._executions: Deque[ExecutionLog] = deque(maxlen=MAX_EXECUTIONS)
         self._session_id = f"sandbox_{int(time.time())}"
         
+        # Lines currently on disk, used to decide when to compact
+        self._line_counts: Dict[Path, int] = {self.log_file: 0, self.execution_log_file: 0}
+        
+        # Records waiting to be appended, keyed by file
+        self.flush_every = flush_every
+        self._write_buffer: Dict[Path, List[Dict[str, Any]]] = defaultdict(list)
+        self._pending = 0
+        
         self._load()
     
+    def _migrate_legacy(self) -> None:
+        """Convert logs written in the old single-document JSON format."""
+        legacy = [
+            (self.storage_path / "operations.json", self.log_file, "entries", MAX_OPERATIONS),
+            (self.storage_path / "executions.json", self.execution_log_file, "executions", MAX_EXECUTIONS),
+        ]
+        for legacy_file, jsonl_file, key, limit in legacy:
+            if jsonl_file.exists() or not legacy_file.exists():
+                continue
+            try:
+                data = json_loads(legacy_file.read_bytes())
+                _write_jsonl(jsonl_file, data.get(key, [])[-limit:])
+            except Exception:
+                pass
+    
     def _load(self) -> None:
         """Load existing logs from disk."""
+        self._migrate_legacy()
+        
         if self.log_file.exists():
             try:
-                data = json.loads(self.log_file.read_text(encoding="utf-8"))
-                self._entries = [SandboxLogEntry.from_dict(e) for e in data.get("entries", [])[-500:]]
+                records, self._line_counts[self.log_file] = _read_jsonl(self.log_file, MAX_OPERATIONS)
+                self._entries.extend(SandboxLogEntry.from_dict(e) for e in records)
             except Exception:
                 pass
         
         if self.execution_log_file.exists():
             try:
-                data = json.loads(self.execution_log_file.read_text(encoding="utf-8"))
-                self._executions = [
+                records, self._line_counts[self.execution_log_file] = _read_jsonl(
+                    self.execution_log_file, MAX_EXECUTIONS
+                )
+                self._executions.extend(
                     ExecutionLog(**{k: v for k, v in e.items() if k != "code_length"})
-                    for e in data.get("executions", [])[-200:]
-                ]
+                    for e in records
+                )
             except Exception:
                 pass
     
+    def _rewrite(self, path: Path) -> None:
+        """Rewrite one log file from the in-memory records."""
+        if path == self.log_file:
+            records = [e.to_dict() for e in self._entries]
+        else:
+            records = [e.to_dict() for e in self._executions]
+        _write_jsonl(path, records)
+        self._line_counts[path] = len(records)
+    
     def _save(self) -> None:
-        """Save logs to disk."""
-        # Save operation logs
-        data = {
-            "version": 1,
-            "updated_at": time.time(),
-            "entries": [e.to_dict() for e in self._entries[-500:]],
-        }
-        self.log_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        """Rewrite both log files from the in-memory state."""
+        self._write_buffer.clear()
+        self._pending = 0
+        self._rewrite(self.log_file)
+        self._rewrite(self.execution_log_file)
+    
+    def _queue_write(self, path: Path, record: Dict[str, Any]) -> None:
+        """Buffer a record for `path`, flushing once enough have accumulated."""
+        self._write_buffer[path].append(record)
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Append buffered records to disk, one write per file."""
+        if not self._pending:
+            return
         
-        # Save execution logs
-        exec_data = {
-            "version": 1,
-            "updated_at": time.time(),
-            "executions": [e.to_dict() for e in self._executions[-200:]],
-        }
-        self.execution_log_file.write_text(json.dumps(exec_data, indent=2), encoding="utf-8")
+        # Swap the buffer out first so a failed write is never retried
+        # (or re-appended to a file that already succeeded)
+        buffer, self._write_buffer = self._write_buffer, defaultdict(list)
+        self._pending = 0
+        
+        limits = {self.log_file: MAX_OPERATIONS, self.execution_log_file: MAX_EXECUTIONS}
+        for path, records in buffer.items():
+            try:
+                _append_jsonl(path, records)
+                self._line_counts[path] += len(records)
+                
+                # Compact files that have grown to twice their limit
+                if self._line_counts[path] >= 2 * limits[path]:
+                    self._rewrite(path)
+            except OSError as e:
+                logger.error(f"Failed to write sandbox log {path.name}: {e}")
     
     def set_session(self, session_id: str) -> None:
         """Set the current session ID."""
@@ -180,7 +305,7 @@ class SandboxLogger:
         )
         
         self._entries.append(entry)
-        self._save()
+        self._queue_write(self.log_file, entry.to_dict())
         return entry
     
     def log_file_read(self, path: str, success: bool = True, size: int = 0, error: str = None) -> SandboxLogEntry:
@@ -264,6 +389,7 @@ class SandboxLogger:
         )
         
         self._executions.append(log)
+        self._queue_write(self.execution_log_file, log.to_dict())
         
         # Also log as operation
         self.log_operation(
@@ -283,7 +409,7 @@ class SandboxLogger:
     
     def get_recent_operations(self, limit: int = 50, operation: Optional[SandboxOperation] = None) -> List[Dict]:
         """Get recent operations."""
-        entries = self._entries
+        entries = list(self._entries)
         
         if operation:
             entries = [e for e in entries if e.operation == operation]
@@ -292,7 +418,7 @@ class SandboxLogger:
     
     def get_recent_executions(self, limit: int = 20, successful_only: bool = False) -> List[Dict]:
         """Get recent code executions."""
-        executions = self._executions
+        executions = list(self._executions)
         
         if successful_only:
             executions = [e for e in executions if e.success]
@@ -378,8 +504,12 @@ class SandboxLogger:
         cutoff = time.time() - (older_than_days * 86400)
         
         old_count = len(self._entries)
-        self._entries = [e for e in self._entries if e.timestamp > cutoff]
-        self._executions = [e for e in self._executions if e.timestamp > cutoff]
+        self._entries = deque(
+            (e for e in self._entries if e.timestamp > cutoff), maxlen=MAX_OPERATIONS
+        )
+        self._executions = deque(
+            (e for e in self._executions if e.timestamp > cutoff), maxlen=MAX_EXECUTIONS
+        )
         
         removed = old_count - len(self._entries)
         self._save()
@@ -395,5 +525,6 @@ def get_sandbox_logger() -> SandboxLogger:
     global _sandbox_logger
     if _sandbox_logger is None:
         _sandbox_logger = SandboxLogger()
+        atexit.register(_sandbox_logger.flush)
     return _sandbox_logger
 
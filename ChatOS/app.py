@@ -122,6 +122,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logging.warning(f"Error cleaning up LLM client: {e}")
     
+    # Close the shared web scraper client
+    try:
+        from ChatOS.ingestion.web_scraper import close_scraper_client
+        await close_scraper_client()
+    except Exception as e:
+        logging.warning(f"Error closing web scraper client: {e}")
+    
     # Close cache connections
     try:
         from ChatOS.controllers.cache import close_cache
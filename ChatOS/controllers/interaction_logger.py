@@ -18,13 +18,16 @@ import time
 import asyncio
 import logging
 import hashlib
-from datetime import datetime
+import re
+from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import httpx
 
+from ChatOS.utils.fast_json import json_dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +63,44 @@ class ReasoningCategory(str, Enum):
     GENERAL = "general"
 
 
+# Keywords used to classify reasoning interactions, in priority order.
+# Each list is matched as plain substrings of the lowercased text.
+_REASONING_KEYWORDS = [
+    (ReasoningCategory.UI_ANALYSIS, ["button", "input", "component", "modal", "card", "form", "ui"]),
+    (ReasoningCategory.ACCESSIBILITY, ["accessibility", "wcag", "aria", "screen reader", "a11y"]),
+    (ReasoningCategory.CODE_GENERATION, ["create", "generate", "build", "implement", "write code", "component"]),
+    (ReasoningCategory.LAYOUT_DESIGN, ["layout", "grid", "flexbox", "responsive", "spacing"]),
+    (ReasoningCategory.DEBUG, ["debug", "fix", "error", "bug", "issue", "not working"]),
+    (ReasoningCategory.REFACTOR, ["refactor", "clean up", "improve code", "optimize"]),
+    (ReasoningCategory.UX_REASONING, ["user experience", "usability", "ux", "user flow"]),
+]
+
+# Precompiled so each category is a single regex scan instead of one
+# substring check per keyword
+_REASONING_PATTERNS = [
+    (category.value, re.compile("|".join(re.escape(kw) for kw in keywords)))
+    for category, keywords in _REASONING_KEYWORDS
+]
+
+
+_THINK_RE = re.compile(r'<think>(.*?)</think>', re.DOTALL)
+_ANSWER_RE = re.compile(r'<answer>(.*?)</answer>', re.DOTALL)
+
+_CATEGORY_SYSTEM_PROMPTS = {
+    ReasoningCategory.UI_ANALYSIS.value: "You are PersRM, an expert UI/UX analyst. Analyze components for usability, accessibility, and best practices. Structure your response with <think>...</think> for reasoning and <answer>...</answer> for recommendations.",
+    ReasoningCategory.CODE_GENERATION.value: "You are PersRM, an expert code generator. Write clean, accessible, well-typed code. Structure your response with <think>...</think> for planning and <answer>...</answer> for the code.",
+    ReasoningCategory.ACCESSIBILITY.value: "You are PersRM, an accessibility expert. Identify WCAG violations and provide fixes. Structure your response with <think>...</think> for analysis and <answer>...</answer> for recommendations.",
+    ReasoningCategory.DEBUG.value: "You are PersRM, a debugging expert. Systematically identify and fix issues. Structure your response with <think>...</think> for analysis and <answer>...</answer> for the solution.",
+}
+_DEFAULT_SYSTEM_PROMPT = "You are PersRM, an AI reasoning assistant. Provide structured reasoning with <think>...</think> and conclusions with <answer>...</answer>."
+
+_EXTENSION_LANGUAGES = {
+    ".py": "python", ".js": "javascript", ".ts": "typescript",
+    ".jsx": "jsx", ".tsx": "tsx", ".html": "html", ".css": "css",
+    ".json": "json", ".md": "markdown", ".sh": "bash",
+}
+
+
 @dataclass
 class Interaction:
     """A single user interaction with PersRM reasoning support."""
@@ -104,8 +145,7 @@ class Interaction:
         if not self.response:
             return None
         
-        import re
-        match = re.search(r'<think>(.*?)</think>', self.response, re.DOTALL)
+        match = _THINK_RE.search(self.response)
         if match:
             return match.group(1).strip()
         return None
@@ -115,8 +155,7 @@ class Interaction:
         if not self.response:
             return None
         
-        import re
-        match = re.search(r'<answer>(.*?)</answer>', self.response, re.DOTALL)
+        match = _ANSWER_RE.search(self.response)
         if match:
             return match.group(1).strip()
         # If no answer tags, return the response without thinking
@@ -218,16 +257,7 @@ class Interaction:
     
     def _get_system_prompt_for_category(self) -> str:
         """Get appropriate system prompt based on reasoning category."""
-        prompts = {
-            ReasoningCategory.UI_ANALYSIS.value: "You are PersRM, an expert UI/UX analyst. Analyze components for usability, accessibility, and best practices. Structure your response with <think>...</think> for reasoning and <answer>...</answer> for recommendations.",
-            ReasoningCategory.CODE_GENERATION.value: "You are PersRM, an expert code generator. Write clean, accessible, well-typed code. Structure your response with <think>...</think> for planning and <answer>...</answer> for the code.",
-            ReasoningCategory.ACCESSIBILITY.value: "You are PersRM, an accessibility expert. Identify WCAG violations and provide fixes. Structure your response with <think>...</think> for analysis and <answer>...</answer> for recommendations.",
-            ReasoningCategory.DEBUG.value: "You are PersRM, a debugging expert. Systematically identify and fix issues. Structure your response with <think>...</think> for analysis and <answer>...</answer> for the solution.",
-        }
-        return prompts.get(
-            self.reasoning_category,
-            "You are PersRM, an AI reasoning assistant. Provide structured reasoning with <think>...</think> and conclusions with <answer>...</answer>."
-        )
+        return _CATEGORY_SYSTEM_PROMPTS.get(self.reasoning_category, _DEFAULT_SYSTEM_PROMPT)
 
 
 class InteractionLogger:
@@ -285,6 +315,10 @@ class InteractionLogger:
             "last_flush": None,
         }
         
+        # Daily log file, rebuilt only when the date rolls over
+        self._log_date: Optional[str] = None
+        self._log_file: Optional[Path] = None
+        
         # Session tracking
         self._current_session_id = self._generate_session_id()
         
@@ -409,12 +443,7 @@ class InteractionLogger:
         # Detect language from file extension if not provided
         if not language:
             ext = Path(file_path).suffix.lower()
-            language_map = {
-                ".py": "python", ".js": "javascript", ".ts": "typescript",
-                ".jsx": "jsx", ".tsx": "tsx", ".html": "html", ".css": "css",
-                ".json": "json", ".md": "markdown", ".sh": "bash",
-            }
-            language = language_map.get(ext, "text")
+            language = _EXTENSION_LANGUAGES.get(ext, "text")
         
         return await self.log(
             InteractionType.CODE_EDIT,
@@ -579,40 +608,15 @@ class InteractionLogger:
         """Classify the reasoning category based on text content."""
         text_lower = text.lower()
         
-        # UI/Component analysis
-        if any(kw in text_lower for kw in ["button", "input", "component", "modal", "card", "form", "ui"]):
-            return ReasoningCategory.UI_ANALYSIS.value
-        
-        # Accessibility
-        if any(kw in text_lower for kw in ["accessibility", "wcag", "aria", "screen reader", "a11y"]):
-            return ReasoningCategory.ACCESSIBILITY.value
-        
-        # Code generation
-        if any(kw in text_lower for kw in ["create", "generate", "build", "implement", "write code", "component"]):
-            return ReasoningCategory.CODE_GENERATION.value
-        
-        # Layout
-        if any(kw in text_lower for kw in ["layout", "grid", "flexbox", "responsive", "spacing"]):
-            return ReasoningCategory.LAYOUT_DESIGN.value
-        
-        # Debug
-        if any(kw in text_lower for kw in ["debug", "fix", "error", "bug", "issue", "not working"]):
-            return ReasoningCategory.DEBUG.value
-        
-        # Refactor
-        if any(kw in text_lower for kw in ["refactor", "clean up", "improve code", "optimize"]):
-            return ReasoningCategory.REFACTOR.value
-        
-        # UX
-        if any(kw in text_lower for kw in ["user experience", "usability", "ux", "user flow"]):
-            return ReasoningCategory.UX_REASONING.value
+        for category, pattern in _REASONING_PATTERNS:
+            if pattern.search(text_lower):
+                return category
         
         return ReasoningCategory.GENERAL.value
     
     def _extract_reasoning_from_response(self, response: str) -> Optional[str]:
         """Extract reasoning trace from response with <think> tags."""
-        import re
-        match = re.search(r'<think>(.*?)</think>', response, re.DOTALL)
+        match = _THINK_RE.search(response)
         if match:
             return match.group(1).strip()
         return None
@@ -650,7 +654,8 @@ class InteractionLogger:
         Flush the buffer to storage and optionally forward to PersRM.
         
         Returns:
-            Number of interactions flushed
+            Number of interactions flushed (excluding any that could not be
+            serialized)
         """
         if not self._buffer:
             return 0
@@ -659,32 +664,48 @@ class InteractionLogger:
         to_flush = self._buffer.copy()
         self._buffer.clear()
         
-        count = len(to_flush)
-        
-        # Save to local storage
-        await self._save_to_local(to_flush)
+        # Encode each interaction once; the same bytes are written to the
+        # JSONL log and spliced into the PersRM payload
+        encoded = self._encode_interactions(to_flush)
+        count = len(encoded)
         
-        # Forward to PersRM if enabled
-        if self.auto_forward:
-            success = await self._forward_to_persrm(to_flush)
-            if success:
-                self._stats["total_forwarded"] += count
+        if encoded:
+            # Save to local storage
+            await self._save_to_local(encoded)
+            
+            # Forward to PersRM if enabled
+            if self.auto_forward:
+                success = await self._forward_to_persrm(encoded)
+                if success:
+                    self._stats["total_forwarded"] += count
         
         self._stats["last_flush"] = time.time()
-        logger.info(f"Flushed {count} interactions")
+        dropped = len(to_flush) - count
+        if dropped:
+            logger.info(f"Flushed {count} interactions ({dropped} dropped as unserializable)")
+        else:
+            logger.info(f"Flushed {count} interactions")
         
         return count
     
-    async def _save_to_local(self, interactions: List[Interaction]) -> bool:
-        """Save interactions to local storage."""
+    def _encode_interactions(self, interactions: List[Interaction]) -> List[bytes]:
+        """Encode interactions to JSON, skipping any that cannot be serialized."""
+        encoded = []
+        for interaction in interactions:
+            try:
+                encoded.append(json_dumps(interaction.to_dict(), default=str))
+            except Exception as e:
+                logger.error(f"Failed to encode interaction: {e}")
+                self._stats["total_errors"] += 1
+        return encoded
+    
+    async def _save_to_local(self, encoded: List[bytes]) -> bool:
+        """Save pre-encoded interactions to local storage."""
         try:
-            # Group by date for organized storage
-            date_str = datetime.now().strftime("%Y-%m-%d")
-            log_file = self.storage_dir / f"interactions_{date_str}.jsonl"
+            log_file = self._local_log_file()
             
-            with open(log_file, "a") as f:
-                for interaction in interactions:
-                    f.write(json.dumps(interaction.to_dict()) + "\n")
+            # Write off the event loop so forwarding and logging keep running
+            await asyncio.to_thread(self._write_local, log_file, encoded)
             
             return True
         except Exception as e:
@@ -692,22 +713,42 @@ class InteractionLogger:
             self._stats["total_errors"] += 1
             return False
     
-    async def _forward_to_persrm(self, interactions: List[Interaction]) -> bool:
-        """Forward interactions to PersRM."""
+    def _local_log_file(self) -> Path:
+        """Get today's JSONL log file, reusing the cached path within a day."""
+        # Group by date for organized storage
+        date_str = date.today().isoformat()
+        if date_str != self._log_date:
+            self._log_date = date_str
+            self._log_file = self.storage_dir / f"interactions_{date_str}.jsonl"
+        return self._log_file
+    
+    def _write_local(self, log_file: Path, encoded: List[bytes]) -> None:
+        """Append pre-encoded interactions to a JSONL file (blocking)."""
+        with open(log_file, "ab") as f:
+            f.write(b"".join(line + b"\n" for line in encoded))
+    
+    async def _forward_to_persrm(self, encoded: List[bytes]) -> bool:
+        """Forward pre-encoded interactions to PersRM."""
+        # Splice the already-encoded interactions into the request body
+        # instead of re-serializing them
+        body = b"".join((
+            b'{"source":"chatos","session_id":',
+            json_dumps(self._current_session_id),
+            b',"interactions":[',
+            b",".join(encoded),
+            b"]}",
+        ))
         try:
             async with httpx.AsyncClient(timeout=10.0) as client:
                 # Send to PersRM's interaction ingestion endpoint
                 response = await client.post(
                     f"{self.persrm_url}/interactions/ingest",
-                    json={
-                        "source": "chatos",
-                        "session_id": self._current_session_id,
-                        "interactions": [i.to_dict() for i in interactions],
-                    }
+                    content=body,
+                    headers={"Content-Type": "application/json"},
                 )
                 
                 if response.status_code == 200:
-                    logger.debug(f"Forwarded {len(interactions)} interactions to PersRM")
+                    logger.debug(f"Forwarded {len(encoded)} interactions to PersRM")
                     return True
                 else:
                     logger.warning(f"PersRM returned {response.status_code}")
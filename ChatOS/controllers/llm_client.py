@@ -15,6 +15,7 @@ Performance Optimizations:
 - Tiered timeouts for different request types
 - Response caching with TTL
 - Proper client lifecycle management
+- orjson decoding of response bodies and stream chunks (if installed)
 """
 
 import asyncio
@@ -34,6 +35,7 @@ from ChatOS.controllers.model_config import (
     PROVIDER_INFO,
     get_model_config_manager,
 )
+from ChatOS.utils.fast_json import json_loads
 
 
 # =============================================================================
@@ -525,7 +527,7 @@ class LLMClient:
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             return LLMResponse(
                 text=data.get("response", ""),
                 model=model_config.model_id,
@@ -580,7 +582,7 @@ class LLMClient:
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             choice = data.get("choices", [{}])[0]
             return LLMResponse(
                 text=choice.get("message", {}).get("content", ""),
@@ -671,7 +673,7 @@ class LLMClient:
                         yield StreamChunk(text="", done=True, finish_reason="stop")
                         break
                     try:
-                        payload = json.loads(data_str)
+                        payload = json_loads(data_str)
                     except json.JSONDecodeError:
                         continue
                     choices = payload.get("choices", [])
@@ -716,7 +718,7 @@ class LLMClient:
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             return LLMResponse(
                 text=data.get("content", ""),
                 model="llama.cpp",
@@ -770,7 +772,7 @@ class LLMClient:
                 if not line:
                     continue
                 try:
-                    data = json.loads(line)
+                    data = json_loads(line)
                 except json.JSONDecodeError:
                     continue
                 
@@ -842,7 +844,7 @@ class LLMClient:
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             text = ""
             for block in data.get("content", []):
                 if block.get("type") == "text":
@@ -917,7 +919,7 @@ class LLMClient:
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             text = ""
             for candidate in data.get("candidates", []):
                 for part in candidate.get("content", {}).get("parts", []):
@@ -1015,7 +1017,7 @@ class LLMClient:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 
                 # Extract response text
                 reply = data.get("reply", "")
@@ -365,27 +365,38 @@ class MemoryLogger:
     # Persistence
     # =========================================================================
     
-    def end_conversation(self, conversation_id: str) -> Optional[ConversationLog]:
-        """End and save a conversation."""
+    def end_conversation(
+        self,
+        conversation_id: str,
+        now: Optional[datetime] = None,
+    ) -> Optional[ConversationLog]:
+        """
+        End and save a conversation.
+        
+        Args:
+            conversation_id: Conversation to end
+            now: End time; callers ending several conversations pass one
+                shared timestamp (default: current time)
+        """
         if conversation_id not in self.active_conversations:
             return None
         
+        now = now or datetime.now()
         conv = self.active_conversations[conversation_id]
-        conv.ended_at = datetime.now().isoformat()
+        conv.ended_at = now.isoformat()
         
         # Save to disk
-        self._save_conversation(conv)
+        self._save_conversation(conv, now.strftime("%Y-%m-%d"))
         
         # Remove from active
         del self.active_conversations[conversation_id]
         
         return conv
     
-    def _save_conversation(self, conv: ConversationLog) -> None:
-        """Save conversation to disk."""
+    def _save_conversation(self, conv: ConversationLog, date_str: str) -> None:
+        """Save conversation to the daily files for `date_str` (YYYY-MM-DD)."""
         with self._save_lock:
             # Daily log file
-            date_str = datetime.now().strftime("%Y-%m-%d")
             log_file = LOGS_DIR / f"conversations_{date_str}.jsonl"
             
             with open(log_file, "a") as f:
@@ -402,8 +413,9 @@ class MemoryLogger:
     def save_all_active(self) -> int:
         """Save all active conversations (e.g., on shutdown)."""
         count = 0
+        now = datetime.now()
         for conv_id in list(self.active_conversations.keys()):
-            self.end_conversation(conv_id)
+            self.end_conversation(conv_id, now=now)
             count += 1
         return count
     
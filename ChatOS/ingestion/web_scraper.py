@@ -131,6 +131,40 @@ DEFAULT_SCRAPE_TARGETS = [
 ]
 
 
+# =============================================================================
+# Shared HTTP Client
+# =============================================================================
+
+# One pooled client shared by every WebScraper, so keep-alive connections
+# survive across scrapes (each caller creates a fresh scraper per URL).
+_http_client = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_http_client():
+    """Get the shared HTTP client, creating it on first use in this event loop."""
+    import httpx
+    
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    # A client's connections are tied to the loop that opened them
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, keepalive_expiry=60.0),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_scraper_client() -> None:
+    """Close the shared scraper HTTP client. Call on application shutdown."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+
+
 # =============================================================================
 # Web Scraper
 # =============================================================================
@@ -209,13 +243,18 @@ class WebScraper:
         headers = {"User-Agent": self.config.user_agent}
         
         try:
-            async with httpx.AsyncClient(timeout=self.config.timeout_seconds) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                
-                if response.status_code == 200:
-                    return response.text, response.status_code, None
-                else:
-                    return None, response.status_code, f"HTTP {response.status_code}"
+            client = _get_http_client()
+            response = await client.get(
+                url,
+                headers=headers,
+                follow_redirects=True,
+                timeout=self.config.timeout_seconds,
+            )
+            
+            if response.status_code == 200:
+                return response.text, response.status_code, None
+            else:
+                return None, response.status_code, f"HTTP {response.status_code}"
         
         except httpx.TimeoutException:
             return None, 0, "Timeout"
@@ -24,6 +24,23 @@ logger = logging.getLogger(__name__)
 USE_STUB = os.getenv("CHATOS_USE_STUB_SUMMARIZATION", "false").lower() == "true"
 SUMMARIZATION_MODEL = os.getenv("CHATOS_SUMMARIZATION_MODEL", "")
 
+
+def _text_digest(text: str) -> str:
+    """
+    Stable digest of text for cache keys.
+    
+    Unlike hash(), this is the same across processes, so keys stay valid
+    in a shared (Redis) cache and after restarts.
+    """
+    data = text.encode("utf-8")
+    try:
+        import xxhash
+        return xxhash.xxh64(data).hexdigest()
+    except ImportError:
+        import hashlib
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
 # Prompt templates
 MEETING_SUMMARY_PROMPT = """You are an AI assistant that summarizes meeting transcripts and extracts action items.
 
@@ -220,7 +237,7 @@ async def summarize_text(
         }
     
     cache = get_cache()
-    cache_key = f"summary:{hash(text)}:{note_type}"
+    cache_key = f"summary:{_text_digest(text)}:{note_type}"
     
     # Check cache first
     cached = await cache.get(cache_key)
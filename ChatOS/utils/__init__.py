@@ -1,11 +1,19 @@
 """
 Utilities package for ChatOS.
 
-Contains helper modules for memory management and RAG.
+Contains helper modules for memory management, RAG and JSON encoding.
 """
 
-from .memory import ChatMemory
-from .rag import RagEngine
-
 __all__ = ["ChatMemory", "RagEngine"]
 
+
+def __getattr__(name):
+    # Imported lazily: rag depends on ChatOS.controllers, which imports this
+    # package, so loading it eagerly here creates an import cycle.
+    if name == "ChatMemory":
+        from .memory import ChatMemory
+        return ChatMemory
+    if name == "RagEngine":
+        from .rag import RagEngine
+        return RagEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
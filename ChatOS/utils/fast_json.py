@@ -0,0 +1,60 @@
+"""
+fast_json.py - JSON encoding/decoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Encoders return bytes, ready to write to a file or send as a
+request body.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(raw: Any) -> Any:
+    """
+    Decode JSON from bytes or str, using orjson when available.
+
+    Decoding straight from bytes skips a separate text decode step.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the stdlib exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(
+    data: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+    newline: bool = False,
+) -> bytes:
+    """
+    Encode data to compact JSON bytes, using orjson when available.
+
+    Non-str dict keys are stringified like the stdlib encoder does. Data
+    orjson still rejects (e.g. keys it cannot stringify) is retried with
+    the stdlib encoder before giving up.
+
+    Args:
+        data: Object to encode
+        default: Called for objects that are not natively serializable
+        newline: Append a trailing newline (one JSON Lines row)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except TypeError:
+            pass
+    encoded = json.dumps(data, default=default).encode("utf-8")
+    return encoded + b"\n" if newline else encoded
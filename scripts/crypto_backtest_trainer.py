@@ -15,6 +15,7 @@ Features:
 
 import json
 import random
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 import numpy as np
@@ -30,35 +31,44 @@ BACKTEST_LOG.parent.mkdir(parents=True, exist_ok=True)
 
 class CryptoPrice:
     """Simulated OHLCV price data for crypto."""
+    VOLATILITY = 0.02  # 2% volatility
+
     def __init__(self, symbol="BTC/USDT", timeframe="1h"):
         self.symbol = symbol
         self.timeframe = timeframe
         self.current_price = self._initial_price()
         self.history = []
+        self._pending = deque()  # (candle, raw close) drawn ahead of time
     
     def _initial_price(self):
         prices = {"BTC/USDT": 45000, "ETH/USDT": 2500, "SOL/USDT": 150}
         return prices.get(self.symbol, 100)
     
-    def generate_candle(self):
-        """Generate realistic OHLCV candle."""
-        volatility = 0.02  # 2% volatility
-        change = np.random.normal(0, volatility)
+    def prefetch(self, count):
+        """Draw the next `count` candles in one vectorized pass."""
+        if count <= 0:
+            return
         
-        open_price = self.current_price
-        close_price = open_price * (1 + change)
-        high_price = max(open_price, close_price) * (1 + abs(np.random.normal(0, volatility/2)))
-        low_price = min(open_price, close_price) * (1 - abs(np.random.normal(0, volatility/2)))
-        volume = np.random.uniform(100, 1000)
+        start = self._pending[-1][1] if self._pending else self.current_price
+        changes = np.random.normal(0, self.VOLATILITY, count)
         
-        candle = {
-            "open": round(open_price, 2),
-            "high": round(high_price, 2),
-            "low": round(low_price, 2),
-            "close": round(close_price, 2),
-            "volume": round(volume, 2)
-        }
+        closes = start * np.cumprod(1 + changes)
+        opens = np.concatenate(([start], closes[:-1]))
+        highs = np.maximum(opens, closes) * (1 + np.abs(np.random.normal(0, self.VOLATILITY / 2, count)))
+        lows = np.minimum(opens, closes) * (1 - np.abs(np.random.normal(0, self.VOLATILITY / 2, count)))
+        volumes = np.random.uniform(100, 1000, count)
+        
+        rows = np.round(np.column_stack((opens, highs, lows, closes, volumes)), 2).tolist()
+        for (open_price, high, low, close, volume), exact_close in zip(rows, closes.tolist()):
+            candle = {"open": open_price, "high": high, "low": low, "close": close, "volume": volume}
+            self._pending.append((candle, exact_close))
+    
+    def generate_candle(self):
+        """Generate realistic OHLCV candle."""
+        if not self._pending:
+            self.prefetch(1)
         
+        candle, close_price = self._pending.popleft()
         self.history.append(candle)
         self.current_price = close_price
         return candle
@@ -79,6 +89,7 @@ class StrategyBacktester:
     
     def execute_backtest(self, num_candles=100, strategy_type="momentum"):
         """Run backtest on simulated data."""
+        self.prices.prefetch(num_candles)
         for i in range(num_candles):
             candle = self.prices.generate_candle()
             
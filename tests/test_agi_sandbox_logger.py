@@ -0,0 +1,85 @@
+"""
+Tests for AGI Core Sandbox Logger
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ChatOS.agi_core.sandbox import SandboxLogger, SandboxOperation
+from ChatOS.agi_core.sandbox.logger import MAX_OPERATIONS
+
+
+class TestSandboxLoggerPersistence:
+    """Tests for SandboxLogger JSONL persistence."""
+
+    def test_operations_appended_as_lines(self, tmp_path):
+        logger = SandboxLogger(tmp_path)
+        logger.log_file_read("/a.py", size=10)
+        logger.log_file_write("/b.py", size=20)
+        logger.flush()
+
+        lines = (tmp_path / "operations.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["path"] == "/b.py"
+
+    def test_reload_restores_entries(self, tmp_path):
+        logger = SandboxLogger(tmp_path)
+        logger.log_file_read("/a.py")
+        logger.log_execution(code="print('hi')", stdout="hi")
+        logger.flush()
+
+        reloaded = SandboxLogger(tmp_path)
+        assert len(reloaded._entries) == 2
+        assert reloaded._entries[-1].operation == SandboxOperation.CODE_EXECUTE
+        assert len(reloaded._executions) == 1
+        assert reloaded._executions[0].stdout == "hi"
+
+    def test_file_compacted_when_too_long(self, tmp_path):
+        logger = SandboxLogger(tmp_path)
+        for i in range(2 * MAX_OPERATIONS):
+            logger.log_file_read(f"/f{i}.py")
+        logger.flush()
+
+        lines = (tmp_path / "operations.jsonl").read_text().splitlines()
+        assert len(lines) == MAX_OPERATIONS
+        assert json.loads(lines[-1])["path"] == f"/f{2 * MAX_OPERATIONS - 1}.py"
+
+    def test_writes_buffered_until_flush(self, tmp_path):
+        logger = SandboxLogger(tmp_path, flush_every=3)
+        logger.log_file_read("/a.py")
+        logger.log_file_read("/b.py")
+        assert not (tmp_path / "operations.jsonl").exists()
+
+        logger.log_file_read("/c.py")
+        lines = (tmp_path / "operations.jsonl").read_text().splitlines()
+        assert len(lines) == 3
+
+    def test_legacy_json_migrated(self, tmp_path):
+        legacy = {"version": 1, "entries": [{"operation": "file_read", "path": "/old.py"}]}
+        (tmp_path / "operations.json").write_text(json.dumps(legacy))
+
+        logger = SandboxLogger(tmp_path)
+        assert len(logger._entries) == 1
+        assert logger._entries[0].path == "/old.py"
+        assert (tmp_path / "operations.jsonl").exists()
+
+    def test_non_str_detail_keys_written(self, tmp_path):
+        logger = SandboxLogger(tmp_path)
+        logger.log_operation(SandboxOperation.SEARCH, details={1: "x"})
+        logger.flush()
+
+        lines = (tmp_path / "operations.jsonl").read_text().splitlines()
+        assert json.loads(lines[0])["details"] == {"1": "x"}
+
+    def test_unserializable_record_does_not_block_later_writes(self, tmp_path):
+        logger = SandboxLogger(tmp_path)
+        logger.log_operation(SandboxOperation.SEARCH, details={(1, 2): "x"})
+        logger.flush()
+        logger.log_file_read("/a.py")
+        logger.flush()
+
+        lines = (tmp_path / "operations.jsonl").read_text().splitlines()
+        assert [json.loads(line)["path"] for line in lines] == ["/a.py"]
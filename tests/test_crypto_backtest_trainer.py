@@ -0,0 +1,44 @@
+"""
+Tests for the crypto backtest training data generator script.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from crypto_backtest_trainer import CryptoPrice, StrategyBacktester
+
+
+class TestCryptoPrice:
+    """Tests for simulated candle generation."""
+
+    def test_prefetch_zero_is_noop(self):
+        prices = CryptoPrice()
+        prices.prefetch(0)
+        assert len(prices._pending) == 0
+
+    def test_prefetched_candles_are_consistent(self):
+        prices = CryptoPrice()
+        prices.prefetch(5)
+        candles = [prices.generate_candle() for _ in range(5)]
+
+        for candle in candles:
+            assert candle["low"] <= min(candle["open"], candle["close"])
+            assert candle["high"] >= max(candle["open"], candle["close"])
+        for prev, cur in zip(candles, candles[1:]):
+            assert abs(cur["open"] - prev["close"]) <= 0.01
+
+    def test_generate_candle_without_prefetch(self):
+        prices = CryptoPrice()
+        prices.prefetch(1)
+        prices.generate_candle()
+        assert prices.generate_candle()["close"] > 0
+        assert len(prices.history) == 2
+
+
+class TestStrategyBacktester:
+    """Tests for backtest execution."""
+
+    def test_zero_candles_returns_none(self):
+        assert StrategyBacktester().execute_backtest(num_candles=0) is None
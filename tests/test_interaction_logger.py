@@ -0,0 +1,89 @@
+"""
+Tests for the ChatOS → PersRM interaction logger.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ChatOS.controllers.interaction_logger import InteractionLogger
+
+
+def _read_log(storage_dir: Path):
+    lines = []
+    for log_file in storage_dir.glob("interactions_*.jsonl"):
+        lines.extend(log_file.read_text().splitlines())
+    return [json.loads(line) for line in lines]
+
+
+class _FakeClient:
+    """Stand-in for httpx.AsyncClient that records posted bodies."""
+
+    requests = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def post(self, url, content=None, headers=None):
+        self.requests.append({"url": url, "content": content, "headers": headers})
+        return httpx.Response(200)
+
+
+class TestInteractionLoggerFlush:
+    """Tests for encoding, local persistence and forwarding on flush."""
+
+    @pytest.mark.asyncio
+    async def test_forward_body_is_valid_payload(self, tmp_path):
+        _FakeClient.requests = []
+        logger = InteractionLogger(storage_dir=str(tmp_path), auto_forward=True)
+        await logger.log("chat_message", content="hi")
+        await logger.log("chat_message", content="there")
+
+        with patch("ChatOS.controllers.interaction_logger.httpx.AsyncClient", _FakeClient):
+            assert await logger.flush() == 2
+
+        request = _FakeClient.requests[0]
+        assert request["headers"]["Content-Type"] == "application/json"
+        body = json.loads(request["content"])
+        assert set(body) == {"source", "session_id", "interactions"}
+        assert body["source"] == "chatos"
+        assert body["session_id"] == logger.session_id
+        assert [i["content"] for i in body["interactions"]] == ["hi", "there"]
+        assert body["interactions"] == _read_log(tmp_path)
+        assert logger.get_stats()["total_forwarded"] == 2
+
+    @pytest.mark.asyncio
+    async def test_non_str_metadata_keys_round_trip(self, tmp_path):
+        logger = InteractionLogger(storage_dir=str(tmp_path), batch_size=1, auto_forward=False)
+        await logger.log("chat_message", content="hi", metadata={1: "x"})
+
+        assert _read_log(tmp_path)[0]["metadata"] == {"1": "x"}
+
+    @pytest.mark.asyncio
+    async def test_non_json_metadata_values_stored_as_strings(self, tmp_path):
+        logger = InteractionLogger(storage_dir=str(tmp_path), batch_size=1, auto_forward=False)
+        await logger.log("chat_message", content="hi", metadata={"tags": {"a"}})
+
+        assert _read_log(tmp_path)[0]["metadata"]["tags"] == str({"a"})
+
+    @pytest.mark.asyncio
+    async def test_unserializable_interaction_dropped(self, tmp_path):
+        logger = InteractionLogger(storage_dir=str(tmp_path), auto_forward=False)
+        await logger.log("chat_message", content="bad", metadata={(1, 2): "x"})
+        await logger.log("chat_message", content="ok")
+
+        assert await logger.flush() == 1
+        assert [i["content"] for i in _read_log(tmp_path)] == ["ok"]
+        assert logger.get_stats()["total_errors"] == 1
@@ -446,6 +446,22 @@ class TestMemoryLoggerPersistence:
         assert count == 2
         assert len(memory_logger.active_conversations) == 0
 
+    def test_save_all_active_shares_end_time(self, memory_logger, temp_memory_dir):
+        """Should stamp every conversation with the same end time."""
+        memory_logger.start_conversation()
+        memory_logger.start_conversation()
+
+        with patch("ChatOS.controllers.memory_logger.LOGS_DIR", temp_memory_dir["logs"]), \
+             patch("ChatOS.controllers.memory_logger.TRAINING_DIR", temp_memory_dir["training"]):
+            memory_logger.save_all_active()
+
+        log_files = list(temp_memory_dir["logs"].glob("conversations_*.jsonl"))
+        assert len(log_files) == 1
+
+        with open(log_files[0]) as f:
+            ended = {json.loads(line)["ended_at"] for line in f}
+        assert len(ended) == 1
+
 
 # =============================================================================
 # Training Data Export Tests
@@ -0,0 +1,89 @@
+"""
+Tests for active learning uncertainty sampling.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ChatOS.active_learning.uncertainty_sampler import UncertaintySampler
+
+
+class _FakeQuery:
+    def __init__(self, store):
+        self._store = store
+        self._id = None
+
+    def filter(self, criterion):
+        # criterion is `TrainingExample.id == example_id`
+        self._id = criterion.right.value
+        return self
+
+    def first(self):
+        return self._store.get(self._id)
+
+
+class _FakeSession:
+    """In-memory stand-in for DatabaseSession."""
+
+    def __init__(self, store):
+        self._store = store
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def query(self, model):
+        return _FakeQuery(self._store)
+
+
+def _example(example_id):
+    return SimpleNamespace(
+        id=example_id,
+        user_input=f"question {example_id}",
+        assistant_output=f"answer {example_id}",
+        confidence_score=None,
+        extra_data=None,
+    )
+
+
+class TestUpdateConfidenceBatch:
+    """Tests for concurrent confidence updates."""
+
+    @pytest.mark.asyncio
+    async def test_batch_counts_progress_and_isolates_failures(self):
+        # 2 is missing, 3 fails to evaluate, 5 is deleted mid-evaluation
+        store = {i: _example(i) for i in (1, 3, 4, 5)}
+
+        async def evaluate(user_input, expected_output):
+            if user_input == "question 3":
+                raise RuntimeError("model unavailable")
+            if user_input == "question 5":
+                del store[5]
+            return 0.25, "unsure"
+
+        sampler = UncertaintySampler(max_concurrent=2)
+        progress = []
+
+        with patch(
+            "ChatOS.active_learning.uncertainty_sampler.DatabaseSession",
+            lambda: _FakeSession(store),
+        ), patch.object(sampler, "evaluate_confidence", side_effect=evaluate):
+            updated = await sampler.update_confidence_batch(
+                [1, 2, 3, 4, 5],
+                progress_callback=lambda done, total: progress.append((done, total)),
+            )
+
+        assert updated == 2
+        assert progress == [(i, 5) for i in range(1, 6)]
+        for example_id in (1, 4):
+            assert store[example_id].confidence_score == 0.25
+            assert store[example_id].extra_data["uncertainty_reason"] == "unsure"
+        assert store[3].confidence_score is None